@@ -2,6 +2,7 @@ import sys
 import warnings
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -139,6 +140,86 @@ def test_convert_jp2_to_tiff(samples_path, tmp_path):
     assert result.exit_code == 0
 
 
+def test_convert_prefetch_factor(samples_path, tmp_path):
+    """Test the CLI for converting with a prefetch factor."""
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        in_path = str(samples_path / "XYC.jp2")
+        out_path = str(Path(td) / "XYC.tiff")
+        result = runner.invoke(
+            cli.convert,
+            ["-i", in_path, "-o", out_path, "--prefetch-factor", "4"],
+            catch_exceptions=False,
+        )
+    assert result.exit_code == 0
+
+
+def test_convert_prefetch_factor_zero(samples_path, tmp_path):
+    """Check that a prefetch factor below one is a usage error."""
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        in_path = str(samples_path / "XYC.jp2")
+        out_path = str(Path(td) / "XYC.tiff")
+        result = runner.invoke(
+            cli.convert,
+            ["-i", in_path, "-o", out_path, "--prefetch-factor", "0"],
+        )
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize(
+    ["codec", "level", "expected"],
+    [
+        ("deflate", None, 6),
+        ("deflate", 70, 12),
+        ("deflate", 0, 1),
+        ("zstd", None, 3),
+        ("webp", 70, 70),
+        ("jpeg", None, 0),
+        ("jpeg", 95, 95),
+    ],
+)
+def test_normalize_compression_level(codec, level, expected):
+    """Test that compression levels are defaulted and clamped per codec."""
+    assert cli._normalize_compression_level(codec, level) == expected
+
+
+def test_normalize_compression_level_tier():
+    """Test that compression tiers map to per codec levels."""
+    assert cli._normalize_compression_level("zstd", None, "archive") == 19
+    assert cli._normalize_compression_level("deflate", None, "fast") == 1
+    assert cli._normalize_compression_level("zstd", 5, "archive") == 5
+    with pytest.raises(click.BadParameter):
+        cli._normalize_compression_level("jpeg", None, "fast")
+
+
+def test_convert_compression_tier(samples_path, tmp_path):
+    """Convert JP2 to a zstd TIFF using a compression tier."""
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        in_path = str(samples_path / "XYC.jp2")
+        out_path = str(Path(td) / "XYC.tiff")
+        result = runner.invoke(
+            cli.convert,
+            ["-i", in_path, "-o", out_path, "-c", "zstd", "-ct", "balanced"],
+            catch_exceptions=False,
+        )
+    assert result.exit_code == 0
+
+
+def test_convert_compression_tier_and_level(samples_path, tmp_path):
+    """Check that a compression tier and level cannot both be given."""
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=tmp_path) as td:
+        in_path = str(samples_path / "XYC.jp2")
+        out_path = str(Path(td) / "XYC.tiff")
+        result = runner.invoke(
+            cli.convert,
+            ["-i", in_path, "-o", out_path, "-ct", "fast", "-cl", "3"],
+        )
+    assert result.exit_code != 0
+
+
 def test_convert_jp2_to_zarr(samples_path, tmp_path):
     """Test the CLI for converting JP2 to zarr."""
     runner = CliRunner()
@@ -1,6 +1,8 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
+import tifffile
 
 import wsic
 
@@ -46,3 +48,43 @@ class TestGetTileScenareos:
 
         tile = reader.get_tile((0, 0), decode=False)
         assert isinstance(tile, bytes)
+
+
+def test_tiff_reader_getitem(samples_path):
+    """Test that TIFFReader reads the same pixels as tifffile."""
+    path = samples_path / "CMU-1-Small-Region.svs"
+    reader = wsic.readers.TIFFReader(path)
+    image = tifffile.imread(path)
+
+    region = reader[100:612, 1500:2900]
+    assert region.shape == (512, 720, 3)
+    assert np.array_equal(region, image[100:612, 1500:2900])
+    assert np.array_equal(reader[5, :7, 1], image[5, :7, 1])
+
+
+def test_from_file_caches_file_types(samples_path):
+    """Test that file types are sniffed once per file version."""
+    wsic.readers._cached_file_types.cache_clear()
+    path = samples_path / "XYC.jp2"
+    wsic.readers.Reader.from_file(path)
+    wsic.readers.Reader.from_file(path)
+    info = wsic.readers._cached_file_types.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_jp2_reader_openjpeg_threads(samples_path):
+    """Test that JP2Reader applies its openjpeg thread count on read."""
+    import glymur
+
+    multithreaded = glymur.options.version.openjpeg_version_tuple >= (2, 2, 0)
+    num_threads = glymur.get_option("lib.num_threads")
+    try:
+        reader = wsic.readers.JP2Reader(samples_path / "XYC.jp2", openjpeg_threads=1)
+        reader[:64, :64]
+        if multithreaded:
+            assert glymur.get_option("lib.num_threads") == 1
+    finally:
+        # The glymur option is process wide, restore it for later tests
+        if multithreaded:
+            glymur.set_option("lib.num_threads", num_threads)
@@ -1,6 +1,7 @@
 """Tests for `wsic` package."""
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -10,7 +11,7 @@ import pytest
 import tifffile
 import zarr
 
-from wsic import readers, utils, writers
+from wsic import readers, tile_iterators, utils, writers
 from wsic.enums import Codec, ColorSpace
 from wsic.readers import Reader
 from wsic.writers import Writer
@@ -533,6 +534,116 @@ def test_copy_from_reader_timeout(samples_path, tmp_path):
         writer.copy_from_reader(reader=reader, timeout=0)
 
 
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_pool_tile_iterator(samples_path, executor_cls):
+    """Check that PoolTileIterator yields tiles in order."""
+    reader = readers.Reader.from_file(samples_path / "XYC.jp2")
+    tile_iterator = tile_iterators.PoolTileIterator(
+        reader=reader,
+        read_tile_size=(256, 256),
+        num_workers=2,
+        executor_cls=executor_cls,
+    )
+    tiles = list(tile_iterator)
+    assert len(tiles) == len(tile_iterator)
+    assert np.all(tile_iterator.read_state == tile_iterators.READ_DONE)
+    assert tile_iterator.num_enqueued == 0
+    assert np.all(tiles[0] == reader[:256, :256])
+    assert np.all(tiles[1] == reader[:256, 256:512])
+
+
+def test_tile_iterator_read_smaller_than_yield(samples_path):
+    """Check yield tiles are only returned once all reads are written."""
+    reader = readers.Reader.from_file(samples_path / "XYC.jp2")
+    with writers.ZarrIntermediate(None, reader.shape) as intermediate:
+        tile_iterator = tile_iterators.PersistentMultiProcessTileIterator(
+            reader=reader,
+            read_tile_size=(128, 128),
+            yield_tile_size=(256, 256),
+            intermediate=intermediate,
+            num_workers=2,
+        )
+        tiles = list(tile_iterator)
+    assert len(tiles) == 4
+    for (j, i), tile in zip(np.ndindex(2, 2), tiles):
+        assert np.all(tile == reader[j * 256 : (j + 1) * 256, i * 256 : (i + 1) * 256])
+
+
+@pytest.mark.parametrize(
+    ["sample", "reader_cls"],
+    [
+        ("XYC.jp2", readers.JP2Reader),
+        ("XYC-half-mpp.tiff", readers.TIFFReader),
+    ],
+)
+@pytest.mark.parametrize("codec", ["deflate", "zstd"])
+def test_tiff_non_square_tiles(samples_path, tmp_path, codec, sample, reader_cls):
+    """Check that non-square (width, height) tiles round-trip."""
+    reader = reader_cls(samples_path / sample)
+    writer = writers.TIFFWriter(
+        path=tmp_path / "image.tiff",
+        shape=reader.shape,
+        tile_size=(128, 64),
+        codec=codec,
+        pyramid_downsamples=[2],
+    )
+    writer.copy_from_reader(reader=reader, num_workers=2, read_tile_size=(128, 64))
+    with tifffile.TiffFile(writer.path) as tif:
+        page = tif.pages[0]
+        assert (page.tilewidth, page.tilelength) == (128, 64)
+        assert np.array_equal(page.asarray(), reader[:, :])
+        level = tif.series[0].levels[1].asarray()
+    assert level.shape == (reader.shape[0] // 2, reader.shape[1] // 2, 3)
+
+
+def test_encode_tiles_order_and_padding():
+    """Check that encode_tiles keeps tile order and pads edge tiles."""
+    import imagecodecs
+
+    tiles = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(9)]
+    tiles[-1] = tiles[-1][:2, :3]
+    encoded = list(
+        writers.encode_tiles(
+            tiles, imagecodecs.deflate_encode, tile_shape=(4, 4, 3), num_workers=2
+        )
+    )
+    assert len(encoded) == 9
+    for i, data in enumerate(encoded[:-1]):
+        assert np.all(np.frombuffer(imagecodecs.deflate_decode(data), np.uint8) == i)
+    last = np.frombuffer(imagecodecs.deflate_decode(encoded[-1]), np.uint8)
+    last = last.reshape(4, 4, 3)
+    assert np.all(last[:2, :3] == 8)
+    assert np.all(last[2:] == 0)
+
+
+@pytest.mark.parametrize("factor", [2, 3, 4])
+def test_np_downsample_matches_mean_pool(factor):
+    """Check the NumPy downsample matches a float mean pool."""
+    rng = np.random.default_rng(123)
+    image = rng.integers(0, 256, (67, 45, 3), dtype=np.uint8)
+    expected = utils.mean_pool(image.astype(float), factor).astype(np.uint8)
+    result = writers.downsample_tile(image, factor, method="np")
+    assert result.dtype == np.uint8
+    assert np.array_equal(result, expected)
+
+
+def test_available_cpu_count(monkeypatch):
+    """Check available_cpu_count respects the CPU affinity mask."""
+    monkeypatch.setattr(
+        utils.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False
+    )
+    assert utils.available_cpu_count() == 2
+    monkeypatch.delattr(utils.os, "sched_getaffinity")
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: None)
+    assert utils.available_cpu_count() == 1
+
+
+def test_mosaic_shape():
+    """Check mosaic_shape uses exact integer ceiling division."""
+    assert utils.mosaic_shape((13, 13, 3), (8, 8, 3)) == (2, 2, 1)
+    assert utils.mosaic_shape((2**60 + 1,), (2,)) == (2**59 + 1,)
+
+
 def test_block_downsample_shape():
     """Test that the block downsample shape is correct."""
     shape = (135, 145)
@@ -74,6 +74,58 @@ def get_writer_class(out_path: Path, writer: str) -> wsic.writers.Writer:
     return ext2writer[out_path.suffix] if writer == "auto" else writers[writer]
 
 
+# Default and (min, max) compression levels for codecs with a level range
+compression_levels = {
+    "deflate": (6, (1, 12)),
+    "webp": (None, (0, 100)),
+    "zstd": (3, (1, 22)),
+}
+
+# Compression levels for named speed / size trade-offs
+compression_tiers = {
+    "deflate": {"fast": 1, "balanced": 6, "archive": 12},
+    "zstd": {"fast": 3, "balanced": 15, "archive": 19},
+}
+
+
+def _normalize_compression_level(
+    codec: str, level: Optional[int], tier: Optional[str] = None
+) -> int:
+    """Get a valid compression level for a codec.
+
+    Levels beyond the range of the codec are clamped rather than
+    silently saturating to the slowest setting (e.g. DEFLATE levels
+    above 12).
+
+    Args:
+        codec (str):
+            The compression codec.
+        level (Optional[int]):
+            The requested compression level. If None, use the level
+            for tier or the default for the codec.
+        tier (Optional[str]):
+            A named compression tier ("fast", "balanced", or
+            "archive"). Ignored if level is given.
+
+    Returns:
+        int:
+            The compression level to use.
+    """
+    default, (minimum, maximum) = compression_levels.get(codec, (None, (None, None)))
+    if level is None and tier is not None:
+        if codec not in compression_tiers:
+            raise click.BadParameter(
+                f"Compression tiers are not supported for {codec}.",
+                param_hint="--compression-tier",
+            )
+        return compression_tiers[codec][tier]
+    if level is None:
+        return default or 0
+    if minimum is None:
+        return level
+    return max(minimum, min(level, maximum))
+
+
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(wsic.__version__)
 @click.pass_context
@@ -116,6 +168,17 @@ def main(ctx):
     type=int,
     default=3,
 )
+@click.option(
+    "-pf",
+    "--prefetch-factor",
+    help=(
+        "The number of tile reads to keep in flight per worker."
+        " Higher values use more memory but can hide slow reads"
+        " (e.g. from network storage)."
+    ),
+    type=click.IntRange(min=1),
+    default=2,
+)
 @click.option(
     "-c",
     "--compression",
@@ -139,9 +202,24 @@ def main(ctx):
 @click.option(
     "-cl",
     "--compression-level",
-    help="The compression level to use.",
+    help=(
+        "The compression level to use."
+        " Defaults to 6 for deflate, 3 for zstd, and 0 otherwise."
+    ),
     type=int,
-    default=0,
+    default=None,
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["compression_tier"],
+)
+@click.option(
+    "-ct",
+    "--compression-tier",
+    help=(
+        "Pick a compression level by speed / size trade-off (deflate and zstd only)."
+    ),
+    type=click.Choice(["fast", "balanced", "archive"]),
+    cls=MutuallyExclusiveOption,
+    mutually_exclusive=["compression_level"],
 )
 @click.option(
     "-d",
@@ -195,8 +273,10 @@ def convert(
     tile_size: Tuple[int, int],
     read_tile_size: Tuple[int, int],
     workers: int,
+    prefetch_factor: int,
     compression: str,
-    compression_level: int,
+    compression_level: Optional[int],
+    compression_tier: Optional[str],
     downsample: Tuple[int, ...],
     microns_per_pixel: float,
     ome: bool,
@@ -214,14 +294,20 @@ def convert(
         shape=reader.shape,
         tile_size=tile_size,
         codec=compression,
-        compression_level=compression_level,
+        compression_level=_normalize_compression_level(
+            compression, compression_level, compression_tier
+        ),
         pyramid_downsamples=downsample,
         overwrite=overwrite,
         microns_per_pixel=microns_per_pixel,
         ome=ome,
     )
     writer.copy_from_reader(
-        reader, read_tile_size=read_tile_size, num_workers=workers, timeout=timeout
+        reader,
+        read_tile_size=read_tile_size,
+        num_workers=workers,
+        timeout=timeout,
+        prefetch_factor=prefetch_factor,
     )
 
 
@@ -1,7 +1,7 @@
-import multiprocessing
 import warnings
 from abc import ABC, abstractmethod
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
 
@@ -15,6 +15,7 @@ from wsic.magic import summon_file_types
 from wsic.metadata import ngff
 from wsic.typedefs import PathLike
 from wsic.utils import (
+    available_cpu_count,
     block_downsample_shape,
     mean_pool,
     mosaic_shape,
@@ -25,6 +26,30 @@ from wsic.utils import (
 )
 
 
+@lru_cache(maxsize=128)
+def _cached_file_types(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], ...]:
+    """Return the file types of a path, cached per file version.
+
+    The modification time and size are part of the cache key so that a
+    file which is replaced at the same path is sniffed again.
+
+    Args:
+        path (str):
+            The path to the file.
+        mtime_ns (int):
+            The modification time of the file in nanoseconds.
+        size (int):
+            The size of the file in bytes.
+
+    Returns:
+        Tuple[Tuple[str, ...], ...]:
+            The file types for which the file has the correct magic.
+    """
+    return tuple(summon_file_types(Path(path)))
+
+
 class Reader(ABC):
     """Base class for readers."""
 
@@ -53,7 +78,8 @@ class Reader(ABC):
             Reader: Reader for file.
         """
         path = Path(path)
-        file_types = summon_file_types(path)
+        stat = path.stat()
+        file_types = _cached_file_types(str(path), stat.st_mtime_ns, stat.st_size)
         if ("jp2",) in file_types:
             return JP2Reader(path)
         with suppress(ImportError):
@@ -221,16 +247,25 @@ class JP2Reader(Reader):
 
     Args:
         path (Path): Path to file.
+        openjpeg_threads (int, optional):
+            Number of threads openjpeg uses to decode each read.
+            Defaults to None (all available CPUs). This suits reading
+            from a single reader. When reading in parallel from many
+            readers (e.g. tile iterator workers), use 1 so that the
+            workers do not each start a thread per CPU and contend for
+            cores. Note that glymur stores the thread count as a
+            process wide option which each reader sets before every
+            read. Reading from readers with different thread counts at
+            the same time (e.g. a thumbnail from the main thread while a
+            tile iterator is running) may make reads use the other
+            reader's thread count.
     """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, openjpeg_threads: Optional[int] = None) -> None:
         super().__init__(path)
         import glymur
 
-        # Enable multithreading
-        if glymur.options.version.openjpeg_version_tuple >= (2, 2, 0):
-            glymur.set_option("lib.num_threads", multiprocessing.cpu_count())
-
+        self.openjpeg_threads = openjpeg_threads or available_cpu_count()
         self.jp2 = glymur.Jp2k(str(path))
         self.shape = self.jp2.shape
         self.dtype = np.uint8
@@ -289,8 +324,21 @@ class JP2Reader(Reader):
             raise ValueError("No SIZ segment found.")
         return (siz.ytsiz, siz.xtsiz)
 
+    def _set_openjpeg_threads(self) -> None:
+        """Set the glymur (openjpeg) thread count for this reader.
+
+        The glymur option is global, so it is set before each read.
+        This is not synchronised with reads from other readers.
+        """
+        import glymur
+
+        # Multithreaded decoding requires openjpeg >= 2.2.0
+        if glymur.options.version.openjpeg_version_tuple >= (2, 2, 0):
+            glymur.set_option("lib.num_threads", self.openjpeg_threads)
+
     def __getitem__(self, index: tuple) -> np.ndarray:
         """Get pixel data at index."""
+        self._set_openjpeg_threads()
         return self.jp2[index]
 
     def thumbnail(self, shape: Tuple[int, ...], approx_ok: bool = False) -> np.ndarray:
@@ -300,6 +348,7 @@ class JP2Reader(Reader):
         # Glymur requires a power of two stride
         pow_2_downsample = 2 ** np.floor(np.log2(downsample))
         # Get the power of two downsample
+        self._set_openjpeg_threads()
         thumbnail = self.jp2[::pow_2_downsample, ::pow_2_downsample]
         # Resize the thumbnail if required
         if approx_ok:
@@ -471,8 +520,43 @@ class TIFFReader(Reader):
         """Get pixel data at index."""
         index = index if isinstance(index, tuple) else (index,)
         index = (self.default_t, self.default_z) + index
+        basic_index = all(isinstance(x, (int, np.integer, slice)) for x in index)
+        known_dims = all(dim in "TZYXC" for dim in self._dataset["0"].dims)
+        if basic_index and known_dims and len(index) <= 5:
+            return self._read_zarr(index)
         return self._tzyxc_dataset["0"][index].as_numpy().data
 
+    def _read_zarr(self, index: Tuple[Union[slice, int], ...]) -> np.ndarray:
+        """Read pixel data directly from the tifffile zarr store.
+
+        Only the TIFF tiles which intersect the index are decoded.
+        This avoids building a dask graph for every read.
+
+        Args:
+            index (Tuple[Union[slice, int], ...]):
+                A TZYXC ordered index of ints and slices.
+
+        Returns:
+            np.ndarray:
+                The pixel data in TZYXC order (excluding integer
+                indexed dimensions).
+        """
+        index = index + (slice(None),) * (5 - len(index))
+        dim_index = dict(zip("TZYXC", index))
+        dims = self._dataset["0"].dims
+        array = self._zarr["0"][tuple(dim_index[dim] for dim in dims)]
+        kept_dims = [dim for dim in dims if isinstance(dim_index[dim], slice)]
+        # Dimensions not in the TIFF are treated as length one
+        for dim in "TZYXC":
+            if dim in dims:
+                continue
+            array = np.expand_dims(array, -1)[..., dim_index[dim]]
+            if isinstance(dim_index[dim], slice):
+                kept_dims.append(dim)
+        return array.transpose(
+            [kept_dims.index(dim) for dim in "TZYXC" if dim in kept_dims]
+        )
+
     def thumbnail(self, shape: Tuple[int, ...], approx_ok: bool = False) -> np.ndarray:
         """Get a thumbnail of the image.
 
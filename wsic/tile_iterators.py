@@ -1,93 +1,195 @@
 import multiprocessing
-import os
+import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-from math import ceil, floor
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from queue import Empty
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 import dask.distributed as daskd
 import numpy as np
-import zarr
 
 from wsic.multiproc import Queue
-from wsic.readers import Reader
-from wsic.utils import mosaic_shape, tile_slices, wrap_index
+from wsic.readers import JP2Reader, Reader
+from wsic.utils import available_cpu_count, mosaic_shape, tile_slices, wrap_index
 
 
-def get_tile(
-    results_queue: Queue,
+# Read tile states, see TileIterator.read_state
+READ_PENDING, READ_ENQUEUED, READ_READY, READ_DONE = range(4)
+
+# Reader opened once per pool worker (thread or process) by _init_worker
+_WORKER = threading.local()
+
+
+def _open_worker_reader(path: Path) -> Reader:
+    """Open a reader for use by one of many parallel workers.
+
+    Readers which decode with their own thread pool (JP2Reader) are
+    limited to one thread, the parallelism comes from the workers.
+
+    Args:
+        path (Path):
+            Path to file to read from.
+
+    Returns:
+        Reader:
+            The reader.
+    """
+    reader = Reader.from_file(path)
+    if isinstance(reader, JP2Reader):
+        reader.openjpeg_threads = 1
+    return reader
+
+
+def _init_worker(path: Path) -> None:
+    """Open a reader for the lifetime of a pool worker.
+
+    The reader is stored thread-locally so that thread pool workers
+    each get their own reader instead of sharing one across threads.
+
+    Args:
+        path (Path):
+            Path to file to read from.
+    """
+    _WORKER.reader = _open_worker_reader(path)
+
+
+def _tile_extents(
+    j: int,
+    i: int,
+    tile_height: int,
+    tile_width: int,
+    height: int,
+    width: int,
+) -> Tuple[int, int, int, int]:
+    """Return the pixel extents of a tile, clipped to the image.
+
+    Args:
+        j (int):
+            Row index of the tile.
+        i (int):
+            Column index of the tile.
+        tile_height (int):
+            Height of a tile.
+        tile_width (int):
+            Width of a tile.
+        height (int):
+            Height of the image.
+        width (int):
+            Width of the image.
+
+    Returns:
+        Tuple[int, int, int, int]:
+            The (start row, stop row, start column, stop column) of
+            the tile.
+    """
+    return (
+        j * tile_height,
+        min((j + 1) * tile_height, height),
+        i * tile_width,
+        min((i + 1) * tile_width, width),
+    )
+
+
+def _read_tile(
+    reader: Reader,
     ji: Tuple[int, int],
     tilesize: Tuple[int, int],
-    path: Path,
-) -> None:
-    """Append a tile read from a reader to a multiprocessing queue.
+) -> np.ndarray:
+    """Read a tile from a reader.
 
     Args:
-        results_queue (Queue):
-            A multiprocessing Queue to put tiles on to.
+        reader (Reader):
+            Reader to read the tile from.
         ji (Tuple[int, int]):
             Index of tile.
         tilesize (Tuple[int, int]):
             Tile size as (width, height).
-        path (Path):
-            Path to file to read from.
 
     Returns:
-        None
+        np.ndarray:
+            The tile.
     """
-    reader = Reader.from_file(path)
-    # Read the tile
-    j, i = ji
-    index = (
-        slice(j * tilesize[1], (j + 1) * tilesize[1]),
-        slice(i * tilesize[0], (i + 1) * tilesize[0]),
+    # Clip to the image so that edge tiles do not read past the edge
+    y0, y1, x0, x1 = _tile_extents(
+        *ji, tilesize[1], tilesize[0], reader.shape[0], reader.shape[1]
     )
-    # Filter warnings (e.g. from gylmur about reading past the edge)
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        tile = reader[index]
-    results_queue.put((ji, tile))
+    return reader[y0:y1, x0:x1]
+
+
+def _worker_get_tile(
+    ji: Tuple[int, int],
+    tilesize: Tuple[int, int],
+) -> Tuple[Tuple[int, int], np.ndarray]:
+    """Read a tile using the reader of the current pool worker.
+
+    Args:
+        ji (Tuple[int, int]):
+            Index of tile.
+        tilesize (Tuple[int, int]):
+            Tile size as (width, height).
+
+    Returns:
+        Tuple[Tuple[int, int], np.ndarray]:
+            The index of the tile and the tile.
+    """
+    return ji, _read_tile(_WORKER.reader, ji, tilesize)
 
 
 def get_tile_persistent(
     results_queue: Queue,
-    ji_queue: Queue,
+    ji_queue: multiprocessing.SimpleQueue,
     tilesize: Tuple[int, int],
     path: Path,
+    slots: Optional[List[Any]] = None,
 ) -> None:
     """Repeatedly append read tiles to a multiprocessing queue.
 
+    Tile indexes are received along with the index of a shared memory
+    slot to write the tile into. Only the tile index, slot index, and
+    tile shape and dtype are put on the results queue. If a tile does
+    not fit in the slot then the tile itself is put on the queue in
+    place of the shape and dtype.
+
     Args:
         results_queue (Queue):
             A multiprocessing Queue to put tiles on to.
-        ji_queue (Queue):
-            A multiprocessing Queue to get tile indexes from.
+        ji_queue (multiprocessing.SimpleQueue):
+            A multiprocessing SimpleQueue to get tile indexes from. A
+            None item stops the worker.
         tilesize (Tuple[int, int]):
             Tile size as (width, height).
         path (Path):
+            Path to file to read from.
+        slots (Optional[List[Any]]):
+            Shared memory buffers (multiprocessing.RawArray) to write
+            tiles into.
 
     Returns:
         None
     """
-    reader = Reader.from_file(path)
+    reader = _open_worker_reader(path)
     while True:
-        ji = ji_queue.get()
-        if ji is None:
+        item = ji_queue.get()
+        if item is None:
             break
-        # Read the tile
-        j, i = ji
-        index = (
-            slice(j * tilesize[1], (j + 1) * tilesize[1]),
-            slice(i * tilesize[0], (i + 1) * tilesize[0]),
-        )
-        # Filter warnings (e.g. from gylmur about reading past the edge)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            tile = reader[index]
-        results_queue.put((ji, tile))
+        ji, slot = item
+        tile = _read_tile(reader, ji, tilesize)
+        if slots is None or tile.nbytes > len(slots[slot]):
+            results_queue.put((ji, slot, tile))
+            continue
+        buffer = np.frombuffer(slots[slot], dtype=tile.dtype, count=tile.size)
+        buffer.reshape(tile.shape)[...] = tile
+        results_queue.put((ji, slot, (tile.shape, tile.dtype.str)))
 
 
 class TileIterator(ABC):
@@ -103,6 +205,7 @@ class TileIterator(ABC):
         verbose: bool = False,
         timeout: float = 10.0,
         match_tile_sizes: bool = True,
+        prefetch_factor: int = 2,
     ) -> None:
         self.reader = reader
         self.shape = reader.shape
@@ -111,13 +214,16 @@ class TileIterator(ABC):
         self.intermediate = intermediate
         self.verbose = verbose
         self.timeout = timeout if timeout >= 0 else float("inf")
-        self.enqueued = set()
-        self.reordering_dict = {}
+        self.prefetch_factor = prefetch_factor
+        # Number of reads submitted but not yet consumed
+        self.num_enqueued = 0
+        # Read tiles keyed by flat (row-major) read index, see tile_key
+        self.reordering_dict: Dict[int, np.ndarray] = {}
         self.read_j = 0
         self.read_i = 0
         self.yield_i = 0
         self.yield_j = 0
-        self.num_workers = num_workers or os.cpu_count() or 2
+        self.num_workers = num_workers or available_cpu_count()
         self.read_mosaic_shape = mosaic_shape(
             self.shape,
             self.read_tile_size[::-1],
@@ -126,8 +232,11 @@ class TileIterator(ABC):
             self.shape,
             self.yield_tile_size[::-1],
         )
-        self.remaining_reads = list(np.ndindex(self.read_mosaic_shape))
-        self.tile_status = zarr.zeros(self.yield_mosaic_shape, dtype="u1")
+        self.read_mosaic_cols = self.read_mosaic_shape[1]
+        self.remaining_reads = deque(np.ndindex(self.read_mosaic_shape))
+        # State of each read tile (READ_PENDING, READ_ENQUEUED,
+        # READ_READY, or READ_DONE) as one byte per tile
+        self.read_state = np.full(self.read_mosaic_shape, READ_PENDING, dtype=np.uint8)
         try:
             from tqdm.auto import tqdm
 
@@ -141,6 +250,10 @@ class TileIterator(ABC):
             self.read_pbar = None
 
         # Validation and error handling
+        if self.prefetch_factor < 1:
+            raise ValueError(
+                f"prefetch_factor ({self.prefetch_factor}) must be at least 1."
+            )
         read_matches_yield = self.read_tile_size == self.yield_tile_size
         if match_tile_sizes and not read_matches_yield and not self.intermediate:
             raise ValueError(
@@ -150,6 +263,11 @@ class TileIterator(ABC):
                 " required when the read and yield tile size differ."
             )
 
+    @property
+    def max_enqueued(self) -> int:
+        """Return the maximum number of reads to have in flight."""
+        return self.num_workers * self.prefetch_factor
+
     def __len__(self) -> int:
         """Return the number of tiles in the reader."""
         return int(np.prod(self.yield_mosaic_shape))
@@ -170,6 +288,49 @@ class TileIterator(ABC):
         """Set the current read index."""
         self.read_j, self.read_i = value
 
+    @property
+    def read_key(self) -> int:
+        """Return the reordering dict key for the current read index."""
+        return self.read_j * self.read_mosaic_cols + self.read_i
+
+    def mark_enqueued(self, ji: Tuple[int, int]) -> None:
+        """Record that a read has been submitted.
+
+        Args:
+            ji (Tuple[int, int]):
+                The (row, column) read index.
+        """
+        self.read_state[ji] = READ_ENQUEUED
+        self.num_enqueued += 1
+
+    def store_tile(self, ji: Tuple[int, int], tile: np.ndarray) -> None:
+        """Add a read tile to the reordering dict.
+
+        Args:
+            ji (Tuple[int, int]):
+                The (row, column) read index.
+            tile (np.ndarray):
+                The read tile.
+        """
+        self.reordering_dict[self.tile_key(ji)] = tile
+        self.read_state[ji] = READ_READY
+
+    def tile_key(self, ji: Tuple[int, int]) -> int:
+        """Return the reordering dict key for a read index.
+
+        Integer keys avoid building and hashing a tuple for every
+        lookup in the iteration loop.
+
+        Args:
+            ji (Tuple[int, int]):
+                The (row, column) read index.
+
+        Returns:
+            int:
+                The flat (row-major) read index.
+        """
+        return ji[0] * self.read_mosaic_cols + ji[1]
+
     @property
     def yield_index(self) -> Tuple[int, int]:
         """Return the current yield index."""
@@ -229,10 +390,17 @@ class TileIterator(ABC):
             # Ensure the queue is kept full
             self.fill_queue()
 
-            # Sleep and try again
-            time.sleep(0.1)
+            # Block until the next read tile arrives (unless it is
+            # already waiting in the reordering dict) and try again
+            if self.read_key in self.reordering_dict:
+                continue
+            # Wait in bounded steps, very long timeouts overflow the
+            # underlying primitives (e.g. select/poll)
+            remaining = self.timeout - (time.perf_counter() - t0)
+            if not self.wait_for_read(min(remaining, 1.0)):
+                break
         warnings.warn(
-            "Failed to get next tile after 100 attempts. Dumping debug information.",
+            "Failed to get next tile before timing out. Dumping debug information.",
             stacklevel=2,
         )
         print(f"Reader Shape {self.reader.shape}")
@@ -242,11 +410,10 @@ class TileIterator(ABC):
         print(f"Yield Mosaic Shape {self.yield_mosaic_shape}")
         print(f"Read Index {self.read_index}")
         print(f"Yield Index {self.yield_index}")
-        print(f"Remaining Reads (:10) {self.remaining_reads[:10]}")
-        print(f"Enqueued {self.enqueued}")
+        print(f"Remaining Reads (:10) {list(islice(self.remaining_reads, 10))}")
+        print(f"Enqueued {np.argwhere(self.read_state == READ_ENQUEUED).tolist()}")
         print(f"Reordering Dict (keys) {self.reordering_dict.keys()}")
-        if hasattr(self, "queue"):
-            print(f"Queue Size {len(self.queue)}")
+        print(f"In Flight Reads {self.num_enqueued}")
         intermediate_read_slices = tile_slices(
             index=(self.yield_j, self.yield_i),
             shape=self.yield_tile_size[::-1],
@@ -260,24 +427,59 @@ class TileIterator(ABC):
         """Read the next tile from the intermediate file."""
         if self.intermediate is None:
             return None
-        intermediate_read_slices = tile_slices(
-            index=(self.yield_j, self.yield_i),
-            shape=self.yield_tile_size[::-1],
+        y0, y1, x0, x1 = _tile_extents(
+            self.yield_j,
+            self.yield_i,
+            self.yield_tile_size[1],
+            self.yield_tile_size[0],
+            self.shape[0],
+            self.shape[1],
         )
-        status = self.tile_status[self.yield_index]
-        if np.all(status == 1):  # Intermediate has all data for the tile
-            self.tile_status[self.yield_index] = 2
+        intermediate_read_slices = (slice(y0, y1), slice(x0, x1))
+        # Intermediate has all data for the tile
+        covering = self.read_state[self.covering_reads(intermediate_read_slices)]
+        if np.all(covering == READ_DONE):
             self.yield_i += 1
             return self.intermediate[intermediate_read_slices]
         return None
 
+    def covering_reads(self, slices: Tuple[slice, slice]) -> Tuple[slice, slice]:
+        """Return the slices of read tile indexes which cover a region.
+
+        Args:
+            slices (Tuple[slice, slice]):
+                Pixel slices (y, x) of the region.
+
+        Returns:
+            Tuple[slice, slice]:
+                Slices (j, i) of the read mosaic which cover the region.
+        """
+        return tuple(
+            slice(x.start // r, -(-min(x.stop, s) // r))
+            for x, r, s in zip(slices, self.read_tile_size[::-1], self.shape)
+        )
+
     @abstractmethod
     def empty_queue(self) -> None:
         """Remove all tiles from the queue into the reordering dict."""
 
     @abstractmethod
     def fill_queue(self) -> None:
-        """Add tile reads to the queue until the max number of workers is reached."""
+        """Add tile reads to the queue until the max number of reads is reached."""
+
+    @abstractmethod
+    def wait_for_read(self, timeout: float) -> bool:
+        """Block until the next read tile has been read or timeout.
+
+        Args:
+            timeout (float):
+                Maximum time to wait in seconds.
+
+        Returns:
+            bool:
+                False if the next read tile is not being read (and so
+                waiting can not make progress), otherwise True.
+        """
 
     def update_read_pbar(self) -> None:
         """Update the read progress bar."""
@@ -293,10 +495,12 @@ class TileIterator(ABC):
                 If an intermediate is being used, or the tile is not
                 in the reordering dict, this will be None.
         """
-        read_ji = (self.read_j, self.read_i)
-        if read_ji in self.reordering_dict:
-            self.enqueued.remove(read_ji)
-            tile = self.reordering_dict.pop(read_ji)
+        read_key = self.read_key
+        if read_key in self.reordering_dict:
+            read_ji = (self.read_j, self.read_i)
+            self.read_state[read_ji] = READ_DONE
+            self.num_enqueued -= 1
+            tile = self.reordering_dict.pop(read_key)
 
             # If no intermediate is required, return the tile
             if not self.intermediate:
@@ -308,18 +512,24 @@ class TileIterator(ABC):
                 return tile
 
             # Otherwise, write the tile to the intermediate
-            intermediate_write_index = tile_slices(
-                index=read_ji,
-                shape=self.read_tile_size,
+            y0, y1, x0, x1 = _tile_extents(
+                self.read_j,
+                self.read_i,
+                self.read_tile_size[1],
+                self.read_tile_size[0],
+                self.shape[0],
+                self.shape[1],
             )
+            intermediate_write_index = (slice(y0, y1), slice(x0, x1))
             self.intermediate[intermediate_write_index] = tile
-            tile_status_index = tuple(
-                slice(max(0, floor(x.start / r)), ceil(x.stop / r))
-                for x, r in zip(intermediate_write_index, self.yield_tile_size)
-            )
-            self.tile_status[tile_status_index] = 1
             self.read_i += 1
             self.update_read_pbar()
+            # A row of yield tiles may need more than one row of reads
+            if (
+                self.read_i == self.read_mosaic_shape[1]
+                and self.read_j + 1 < self.read_mosaic_shape[0]
+            ):
+                self.read_index = (self.read_j + 1, 0)
         return None
 
     def close(self):  # noqa: B027
@@ -330,12 +540,19 @@ class TileIterator(ABC):
         self.close()
 
 
-class MultiProcessTileIterator(TileIterator):
+class PoolTileIterator(TileIterator):
     """An iterator which returns tiles generated by a reader.
 
-    This is a fancy iterator that uses a multiprocress queue to
-    accelerate the reading of tiles. It can also use an intermediate
-    file to allow for reading and writing with different tile sizes.
+    This is a fancy iterator that uses a pool of workers to accelerate
+    the reading of tiles. Each worker opens the reader once and reuses
+    it for every tile it reads. It can also use an intermediate file to
+    allow for reading and writing with different tile sizes.
+
+    By default the workers are threads. This suits readers which
+    release the GIL while decoding (e.g. glymur/openjpeg and
+    openslide) and avoids pickling each decoded tile across a process
+    boundary. A ProcessPoolExecutor can be used instead for readers
+    which hold the GIL.
 
     Args:
         reader (Reader):
@@ -351,6 +568,13 @@ class MultiProcessTileIterator(TileIterator):
             access reads and writes.
         verbose (bool):
             Verbose output.
+        prefetch_factor (int):
+            Number of reads to keep in flight per worker. Higher values
+            hide per-tile read latency (e.g. on network storage) at the
+            cost of holding more tiles in memory. Defaults to 2.
+        executor_cls (Type[Executor]):
+            The executor class used to create the worker pool. Defaults
+            to ThreadPoolExecutor.
 
     Yields:
         np.ndarray:
@@ -367,6 +591,8 @@ class MultiProcessTileIterator(TileIterator):
         verbose: bool = False,
         timeout: float = 10.0,
         match_tile_sizes: bool = True,
+        prefetch_factor: int = 2,
+        executor_cls: Type[Executor] = ThreadPoolExecutor,
     ) -> None:
         super().__init__(
             reader=reader,
@@ -377,51 +603,57 @@ class MultiProcessTileIterator(TileIterator):
             verbose=verbose,
             timeout=timeout,
             match_tile_sizes=match_tile_sizes,
+            prefetch_factor=prefetch_factor,
+        )
+        self.futures: Dict[Tuple[int, int], Future] = {}
+        self.pool = executor_cls(
+            max_workers=self.num_workers,
+            initializer=_init_worker,
+            initargs=(self.reader.path,),
         )
-        self.processes = {}
-        self.queue = Queue()
 
     def empty_queue(self) -> None:
-        """Remove all tiles from the queue into the reordering dict."""
-        while not self.queue.empty():
-            ji, tile = self.queue.get()
-            self.reordering_dict[ji] = tile
-            self.processes.pop(ji).join()
+        """Move all completed reads into the reordering dict."""
+        for ji, future in list(self.futures.items()):
+            if future.done():
+                _, tile = self.futures.pop(ji).result()
+                self.store_tile(ji, tile)
 
     def fill_queue(self) -> None:
-        """Add tile reads to the queue until the max number of workers is reached."""
-        while len(self.enqueued) < self.num_workers and len(self.remaining_reads) > 0:
-            next_ji = self.remaining_reads.pop(0)
-            process = multiprocessing.Process(
-                target=get_tile,
-                args=(
-                    self.queue,
-                    next_ji,
-                    self.read_tile_size,
-                    self.reader.path,
-                ),
-                daemon=True,
+        """Submit tile reads until the max number of reads is reached."""
+        while self.num_enqueued < self.max_enqueued and len(self.remaining_reads) > 0:
+            next_ji = self.remaining_reads.popleft()
+            self.futures[next_ji] = self.pool.submit(
+                _worker_get_tile,
+                next_ji,
+                self.read_tile_size,
             )
-            process.start()
-            self.processes[next_ji] = process
-            self.enqueued.add(next_ji)
+            self.mark_enqueued(next_ji)
+
+    def wait_for_read(self, timeout: float) -> bool:
+        """Block until the next read tile has been read or timeout."""
+        future = self.futures.get(self.read_index)
+        if future is None:
+            return False
+        wait([future], timeout=timeout)
+        return True
 
     def close(self):
         """Safely end any dependants (threads, processes, and files).
 
-        Close progress bars and join child processes. Terminate children
-        if they fail to join after one second.
+        Close progress bars, cancel pending reads, and shut down the
+        worker pool.
         """
         if self.read_pbar is not None:
             self.read_pbar.close()
-        # Join processes in parallel threads
-        if self.processes:
-            with ThreadPoolExecutor(len(self.processes)) as executor:
-                executor.map(lambda p: p.join(1), self.processes.values(), timeout=2)
-            # Terminate any child processes if still alive
-            for process in self.processes.values():
-                if process.is_alive():
-                    process.terminate()
+        if hasattr(self, "pool"):
+            for future in self.futures.values():
+                future.cancel()
+            self.pool.shutdown(wait=False)
+
+
+# Backwards compatible name
+MultiProcessTileIterator = PoolTileIterator
 
 
 class PersistentMultiProcessTileIterator(TileIterator):
@@ -431,6 +663,10 @@ class PersistentMultiProcessTileIterator(TileIterator):
     accelerate the reading of tiles. It can also use an intermediate
     file to allow for reading and writing with different tile sizes.
 
+    Tiles are passed back from the worker processes through a ring of
+    shared memory buffers, one per in-flight read, so that only the
+    tile index and buffer index are pickled and sent over the queue.
+
     Args:
         reader (Reader):
             Reader for image.
@@ -445,6 +681,10 @@ class PersistentMultiProcessTileIterator(TileIterator):
             access reads and writes.
         verbose (bool):
             Verbose output.
+        prefetch_factor (int):
+            Number of reads to keep in flight per worker. Higher values
+            hide per-tile read latency (e.g. on network storage) at the
+            cost of holding more tiles in memory. Defaults to 2.
 
     Yields:
         np.ndarray:
@@ -461,6 +701,7 @@ class PersistentMultiProcessTileIterator(TileIterator):
         verbose: bool = False,
         timeout: float = 10.0,
         match_tile_sizes: bool = True,
+        prefetch_factor: int = 2,
     ) -> None:
         super().__init__(
             reader=reader,
@@ -471,10 +712,24 @@ class PersistentMultiProcessTileIterator(TileIterator):
             verbose=verbose,
             timeout=timeout,
             match_tile_sizes=match_tile_sizes,
+            prefetch_factor=prefetch_factor,
         )
         self.processes = {}
         self.results_queue = Queue()
-        self.index_queue = Queue()
+        # Workers block on get and there is a single producer, so the
+        # index queue does not need Queue's feeder thread or timeouts
+        self.index_queue = multiprocessing.SimpleQueue()
+
+        # Shared memory tile buffers and the indexes of unused buffers
+        tile_bytes = (
+            int(np.prod(self.read_tile_size))
+            * int(np.prod(self.reader.shape[2:]))
+            * np.dtype(self.reader.dtype).itemsize
+        )
+        self.slots = [
+            multiprocessing.RawArray("B", tile_bytes) for _ in range(self.max_enqueued)
+        ]
+        self.free_slots = deque(range(len(self.slots)))
 
         for i in range(self.num_workers):
             process = multiprocessing.Process(
@@ -484,35 +739,76 @@ class PersistentMultiProcessTileIterator(TileIterator):
                     self.index_queue,
                     self.read_tile_size,
                     self.reader.path,
+                    self.slots,
                 ),
                 daemon=True,
             )
             process.start()
             self.processes[i] = process
 
+    def receive(self, result: Tuple[Tuple[int, int], int, Any]) -> None:
+        """Copy a read tile out of its shared memory slot.
+
+        The tile is added to the reordering dict and the slot is freed
+        for reuse.
+
+        Args:
+            result (Tuple[Tuple[int, int], int, Any]):
+                A (ji, slot, payload) tuple from a worker. The payload
+                is either the shape and dtype of the tile in the slot
+                or, if the tile did not fit in the slot, the tile.
+        """
+        ji, slot, payload = result
+        if isinstance(payload, np.ndarray):
+            tile = payload
+        else:
+            shape, dtype = payload
+            count = int(np.prod(shape))
+            buffer = np.frombuffer(self.slots[slot], dtype=dtype, count=count)
+            tile = buffer.reshape(shape).copy()
+        self.store_tile(ji, tile)
+        self.free_slots.append(slot)
+
     def empty_queue(self) -> None:
         """Remove all tiles from the queue into the reordering dict."""
         while not self.results_queue.empty():
-            ji, tile = self.results_queue.get()
-            self.reordering_dict[ji] = tile
+            self.receive(self.results_queue.get())
 
     def fill_queue(self) -> None:
-        """Add tile reads to the queue until the max number of workers is reached."""
-        while len(self.enqueued) < self.num_workers and len(self.remaining_reads) > 0:
-            next_ji = self.remaining_reads.pop(0)
-            self.index_queue.put(next_ji)
-            self.enqueued.add(next_ji)
+        """Add tile reads to the queue until the max number of reads is reached."""
+        while (
+            self.num_enqueued < self.max_enqueued
+            and len(self.remaining_reads) > 0
+            and len(self.free_slots) > 0
+        ):
+            next_ji = self.remaining_reads.popleft()
+            self.index_queue.put((next_ji, self.free_slots.popleft()))
+            self.mark_enqueued(next_ji)
+
+    def wait_for_read(self, timeout: float) -> bool:
+        """Block until a tile has been read or timeout."""
+        if self.read_state[self.read_index] != READ_ENQUEUED:
+            return False
+        try:
+            result = self.results_queue.get(timeout=timeout)
+        except Empty:
+            return True
+        self.receive(result)
+        return True
 
     def close(self):
         """Safely end any dependants (threads, processes, and files).
 
-        Close progress bars and join child processes. Terminate children
-        if they fail to join after one second.
+        Close progress bars, signal child processes to stop, and join
+        them. Terminate children if they fail to join after one second.
         """
         if self.read_pbar is not None:
             self.read_pbar.close()
         # Join processes in parallel threads
         if self.processes:
+            for process in self.processes.values():
+                if process.is_alive():
+                    self.index_queue.put(None)
             with ThreadPoolExecutor(len(self.processes)) as executor:
                 executor.map(lambda p: p.join(1), self.processes.values(), timeout=2)
             # Terminate any child processes if still alive
@@ -548,6 +844,8 @@ class DaskTileIterator(TileIterator):
             Tile size to yield. If None, yield_tile_size = read_tile_size.
         num_workers (int):
             The number of workers to use for reading tiles.
+        prefetch_factor (int):
+            Number of reads to keep in flight per worker. Defaults to 2.
 
     Yields:
         np.ndarray:
@@ -564,6 +862,7 @@ class DaskTileIterator(TileIterator):
         verbose: bool = False,
         timeout: float = 10.0,
         match_tile_sizes: bool = True,
+        prefetch_factor: int = 2,
     ):
         super().__init__(
             reader=reader,
@@ -574,6 +873,7 @@ class DaskTileIterator(TileIterator):
             intermediate=intermediate,
             verbose=verbose,
             match_tile_sizes=match_tile_sizes,
+            prefetch_factor=prefetch_factor,
         )
         self.array = self.reader._dataset["0"]
         try:
@@ -585,25 +885,36 @@ class DaskTileIterator(TileIterator):
 
     def fill_queue(self) -> None:
         """Enqueue futures to read tiles."""
-        while len(self.futures) < self.num_workers:
+        while len(self.futures) < self.max_enqueued:
             try:
-                next_ji = self.remaining_reads.pop(0)
+                next_ji = self.remaining_reads.popleft()
             except IndexError:
                 break
-            slices = tile_slices(
-                index=next_ji,
-                shape=self.read_tile_size,
+            y0, y1, x0, x1 = _tile_extents(
+                *next_ji,
+                self.read_tile_size[1],
+                self.read_tile_size[0],
+                self.reader.shape[0],
+                self.reader.shape[1],
             )
             future = self.client.submit(
                 self.array.__getitem__,
-                slices,
+                (slice(y0, y1), slice(x0, x1)),
             )
             self.futures.append((next_ji, future))
-            self.enqueued.add(next_ji)
+            self.mark_enqueued(next_ji)
 
     def empty_queue(self) -> None:
         """Remove all tiles from the queue into the reordering dict."""
         while self.futures:
             ji, future = self.futures.pop(0)
             tile = future.result().to_numpy()
-            self.reordering_dict[ji] = tile
+            self.store_tile(ji, tile)
+
+    def wait_for_read(self, timeout: float) -> bool:
+        """Check if there are reads in progress.
+
+        Futures are waited upon (blocking) when emptying the queue so
+        there is no need to wait here.
+        """
+        return bool(self.futures)
@@ -1,13 +1,29 @@
 import inspect
+import os
 import warnings
 from contextlib import suppress
-from math import ceil, floor
+from math import floor
 from numbers import Number
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import numpy as np
 
 
+def available_cpu_count() -> int:
+    """Return the number of CPUs the current process may run on.
+
+    Unlike `os.cpu_count`, this respects CPU affinity masks (e.g. from
+    taskset, Slurm, or container runtimes) where supported.
+
+    Returns:
+        int:
+            The number of usable CPUs (at least 1).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 def downsample_shape(
     baseline_shape: Tuple[int, ...],
     downsample: int,
@@ -279,7 +295,8 @@ def mosaic_shape(
         (2, 2, 1)
 
     """
-    return tuple(ceil(x / y) for x, y in zip(array_shape, tile_shape))
+    # Integer ceiling division, avoids float precision loss for large shapes
+    return tuple(-(-x // y) for x, y in zip(array_shape, tile_shape))
 
 
 def strictly_increasing(iterable: Iterable) -> bool:
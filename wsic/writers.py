@@ -5,7 +5,9 @@ import tempfile
 import uuid
 import warnings
 from abc import ABC, abstractmethod
-from functools import partial
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from math import floor
 from numbers import Number
 from pathlib import Path
@@ -30,15 +32,21 @@ from wsic import __version__ as wsic_version
 from wsic.codecs import register_codecs
 from wsic.enums import Codec, ColorSpace
 from wsic.metadata import ngff
-from wsic.readers import DICOMWSIReader, Reader, TIFFReader
-from wsic.tile_iterators import DaskTileIterator
+from wsic.readers import (
+    DICOMWSIReader,
+    JP2Reader,
+    OpenSlideReader,
+    Reader,
+    TIFFReader,
+)
 from wsic.tile_iterators import (
-    PersistentMultiProcessTileIterator as MultiProcessTileIterator,
+    DaskTileIterator,
+    PersistentMultiProcessTileIterator,
+    PoolTileIterator,
 )
 from wsic.typedefs import PathLike
 from wsic.utils import (
     downsample_shape,
-    mean_pool,
     mosaic_shape,
     mpp2ppu,
     scale_to_fit,
@@ -123,6 +131,7 @@ class Writer(ABC):
         yield_tile_size: Tuple[int, int] = None,
         intermediate: zarr.Group = None,
         timeout: float = 10.0,
+        prefetch_factor: int = 2,
     ) -> Iterator[np.ndarray]:
         """Returns an iterator which returns tiles generated by reader.
 
@@ -136,6 +145,11 @@ class Writer(ABC):
                 Defaults to self.tile_size.
             intermediate (np.ndarray, optional):
                 An intermediate image to write tiles to.
+            timeout (float, optional):
+                Timeout for reading a tile. Defaults to 10s.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
 
         Returns:
             Iterator: Iterator which returns tiles generated by reader.
@@ -153,8 +167,23 @@ class Writer(ABC):
                 verbose=self.verbose,
                 timeout=timeout,
                 match_tile_sizes=not isinstance(self, ZarrWriter),
+                prefetch_factor=prefetch_factor,
+            )
+        if isinstance(reader, (JP2Reader, OpenSlideReader)):
+            # These decode in C with the GIL released, so threads give
+            # full parallelism without pickling tiles between processes
+            return PoolTileIterator(
+                reader=reader,
+                read_tile_size=read_tile_size,
+                yield_tile_size=yield_tile_size or self.tile_size,
+                intermediate=intermediate,
+                num_workers=num_workers,
+                verbose=self.verbose,
+                timeout=timeout,
+                match_tile_sizes=not isinstance(self, ZarrWriter),
+                prefetch_factor=prefetch_factor,
             )
-        return MultiProcessTileIterator(
+        return PersistentMultiProcessTileIterator(
             reader=reader,
             read_tile_size=read_tile_size,
             yield_tile_size=yield_tile_size or self.tile_size,
@@ -163,6 +192,7 @@ class Writer(ABC):
             verbose=self.verbose,
             timeout=timeout,
             match_tile_sizes=not isinstance(self, ZarrWriter),
+            prefetch_factor=prefetch_factor,
         )
 
     def __setitem__(
@@ -179,6 +209,7 @@ class Writer(ABC):
         read_tile_size: Tuple[int, int] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Write pixel data to by copying from a Reader.
 
@@ -196,6 +227,9 @@ class Writer(ABC):
                 Downsample method to use when building pyramid levels.
                 Defaults to None. Valid downsample methods are: "cv2",
                 "scipy", "np", None.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
         """
         if self.path.exists() and not self.overwrite:
             raise FileExistsError(f"{self.path} exists and overwrite is False.")
@@ -384,6 +418,7 @@ class JP2Writer(Writer):
         read_tile_size: Optional[Tuple[int, int]] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Write pixel data to by copying from a Reader.
 
@@ -400,6 +435,9 @@ class JP2Writer(Writer):
             downsample_method (str, optional):
                 Downsample method to use. Defaults to None. Not used for
                 JP2Writer, but included for API consistency.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
         """
         warn_unused(downsample_method, ignore_falsey=True)
         super().copy_from_reader(
@@ -408,6 +446,7 @@ class JP2Writer(Writer):
             read_tile_size=read_tile_size,
             timeout=timeout,
             downsample_method=downsample_method,
+            prefetch_factor=prefetch_factor,
         )
         import glymur
 
@@ -441,6 +480,7 @@ class JP2Writer(Writer):
                 intermediate=intermediate,
                 read_tile_size=read_tile_size or self.tile_size,
                 timeout=timeout,
+                prefetch_factor=prefetch_factor,
             )
             reader_tile_iterator = iter(self.level_progress(reader_tile_iterator))
             for tile_writer in jp2.get_tilewriters():
@@ -560,6 +600,7 @@ class TIFFWriter(Writer):
         read_tile_size: Optional[Tuple[int, int]] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Write pixel data to by copying from a Reader.
 
@@ -577,6 +618,9 @@ class TIFFWriter(Writer):
                 Downsample method to use when building pyramid levels.
                 Defaults to None. Valid downsample methods are: "cv2",
                 "scipy", "np", None.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
         """
         super().copy_from_reader(
             reader=reader,
@@ -584,6 +628,7 @@ class TIFFWriter(Writer):
             read_tile_size=read_tile_size,
             timeout=timeout,
             downsample_method=downsample_method,
+            prefetch_factor=prefetch_factor,
         )
         import tifffile
 
@@ -598,6 +643,9 @@ class TIFFWriter(Writer):
             else None
         )
 
+        # tifffile and the tile encoder expect (height, width) tiles
+        tile_shape = tuple(self.tile_size[::-1])
+
         with ZarrIntermediate(
             None, reader.shape, zero_after_read=False
         ) as intermediate:
@@ -607,6 +655,7 @@ class TIFFWriter(Writer):
                 intermediate=intermediate,
                 read_tile_size=read_tile_size or self.tile_size,
                 timeout=timeout,
+                prefetch_factor=prefetch_factor,
             )
             reader_tile_iterator = self.level_progress(reader_tile_iterator)
             # Write baseline (level 0)
@@ -623,8 +672,10 @@ class TIFFWriter(Writer):
                     metadata["PhysicalSizeY"] = self.microns_per_pixel[1]
 
                 tif.write(
-                    data=iter(reader_tile_iterator),
-                    tile=self.tile_size,
+                    data=self.encoded_tiles(
+                        reader_tile_iterator, tile_shape, reader.shape, num_workers
+                    ),
+                    tile=tile_shape,
                     shape=reader.shape,
                     dtype=reader.dtype,
                     photometric=self.color_space,
@@ -646,7 +697,7 @@ class TIFFWriter(Writer):
 
                         level_tiles_shape = mosaic_shape(
                             level_shape,
-                            self.tile_size,
+                            tile_shape,
                         )
 
                         func = partial(
@@ -670,8 +721,10 @@ class TIFFWriter(Writer):
                         )
 
                         tif.write(
-                            data=iter(tile_generator),
-                            tile=self.tile_size,
+                            data=self.encoded_tiles(
+                                tile_generator, tile_shape, level_shape, num_workers
+                            ),
+                            tile=tile_shape,
                             shape=level_shape,
                             dtype=reader.dtype,
                             photometric=self.color_space,
@@ -682,6 +735,46 @@ class TIFFWriter(Writer):
                             subfiletype=1,  # Subfile type: reduced resolution
                         )
 
+    def encoded_tiles(
+        self,
+        tiles: Iterable[np.ndarray],
+        tile_shape: Tuple[int, int],
+        shape: Tuple[int, ...],
+        num_workers: int,
+    ) -> Iterator[Union[np.ndarray, bytes]]:
+        """Get tile data to pass to tifffile for writing.
+
+        DEFLATE tiles are encoded with libdeflate (via imagecodecs) in a
+        pool of threads as they arrive, and passed to tifffile as
+        pre-encoded bytes. Other codecs are left for tifffile to
+        encode.
+
+        Args:
+            tiles (Iterable[np.ndarray]):
+                The tiles to write.
+            tile_shape (Tuple[int, int]):
+                The (height, width) tile shape passed to tifffile. Edge
+                tiles are padded to this shape before encoding.
+            shape (Tuple[int, ...]):
+                The shape of the image being written.
+            num_workers (int):
+                Number of threads to encode with.
+
+        Returns:
+            Iterator[Union[np.ndarray, bytes]]:
+                The tiles or encoded tiles.
+        """
+        if self.codec != Codec.DEFLATE:
+            return iter(tiles)
+        import imagecodecs
+
+        return encode_tiles(
+            tiles,
+            encode=partial(imagecodecs.deflate_encode, level=self.compression_level),
+            tile_shape=tuple(tile_shape) + tuple(shape[2:]),
+            num_workers=num_workers,
+        )
+
     def transcode_from_reader(
         self,
         reader: Union[TIFFReader, DICOMWSIReader],
@@ -860,6 +953,7 @@ class SVSWriter(Writer):
         read_tile_size: Optional[Tuple[int, int]] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Write pixel data to by copying from a Reader.
 
@@ -877,6 +971,9 @@ class SVSWriter(Writer):
                 Downsample method to use when building pyramid levels.
                 Defaults to None. Valid downsample methods are: "cv2",
                 "scipy", "np", None.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
         """
         super().copy_from_reader(
             reader=reader,
@@ -884,6 +981,7 @@ class SVSWriter(Writer):
             read_tile_size=read_tile_size,
             timeout=timeout,
             downsample_method=downsample_method,
+            prefetch_factor=prefetch_factor,
         )
         import tifffile
 
@@ -907,6 +1005,7 @@ class SVSWriter(Writer):
                 intermediate=intermediate,
                 read_tile_size=read_tile_size or self.tile_size,
                 timeout=timeout,
+                prefetch_factor=prefetch_factor,
             )
             reader_tile_iterator = self.level_progress(reader_tile_iterator)
             # Write baseline (level 0)
@@ -1040,7 +1139,7 @@ class SVSWriter(Writer):
                 # Write baseline (level 0, 1st IFD)
                 tif.write(
                     data=iter(reader_tile_iterator),
-                    tile=self.tile_size,
+                    tile=self.tile_size[::-1],
                     shape=reader.shape,
                     dtype=reader.dtype,
                     photometric=self.color_space,
@@ -1090,7 +1189,7 @@ class SVSWriter(Writer):
 
                         level_tiles_shape = mosaic_shape(
                             level_shape,
-                            self.tile_size,
+                            self.tile_size[::-1],
                         )
 
                         func = partial(
@@ -1115,7 +1214,7 @@ class SVSWriter(Writer):
 
                         tif.write(
                             data=iter(tile_generator),
-                            tile=self.tile_size,
+                            tile=self.tile_size[::-1],
                             shape=level_shape,
                             dtype=reader.dtype,
                             photometric=self.color_space,
@@ -1236,6 +1335,7 @@ class ZarrWriter(Writer, Reader):
         read_tile_size: Optional[Tuple[int, int]] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Write pixel data to by copying from a Reader.
 
@@ -1253,6 +1353,9 @@ class ZarrWriter(Writer, Reader):
                 Downsample method to use when building pyramid levels.
                 Defaults to None. Valid downsample methods are: "cv2",
                 "scipy", "np", None.
+            prefetch_factor (int, optional):
+                Number of tile reads to keep in flight per worker.
+                Defaults to 2.
         """
         # Ensure there is a zarr to write to
         self.zarr.create_dataset(
@@ -1280,6 +1383,7 @@ class ZarrWriter(Writer, Reader):
                 num_workers=num_workers,
                 timeout=timeout,
                 intermediate=None if tile_sizes_match else intermediate,
+                prefetch_factor=prefetch_factor,
             )
             reader_tile_iterator = self.level_progress(reader_tile_iterator)
 
@@ -1682,6 +1786,7 @@ class ZarrIntermediate(Writer, Reader):
         read_tile_size: Optional[Tuple[int, int]] = None,
         timeout: float = 10.0,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         """Not supported but included for API consistency."""
         raise NotImplementedError()
@@ -1739,6 +1844,7 @@ class DICOMWSIWriter(Writer):
         read_tile_size: Tuple[int, int] = None,
         timeout: float = 10,
         downsample_method: Optional[str] = None,
+        prefetch_factor: int = 2,
     ) -> None:
         from pydicom import FileDataset, dcmwrite
 
@@ -1782,6 +1888,7 @@ class DICOMWSIWriter(Writer):
                 intermediate=intermediate,
                 read_tile_size=read_tile_size or self.tile_size,
                 timeout=timeout,
+                prefetch_factor=prefetch_factor,
             )
 
             def jpeg_generator(tile_iterator) -> Generator[bytes, None, None]:
@@ -1861,6 +1968,50 @@ class DICOMWSIWriter(Writer):
         append_frames(self.path, tile_generator(), tile_count)
 
 
+def encode_tiles(
+    tiles: Iterable[np.ndarray],
+    encode: Callable[[np.ndarray], bytes],
+    tile_shape: Tuple[int, ...],
+    num_workers: int = 2,
+) -> Iterator[bytes]:
+    """Encode tiles in a thread pool, yielding the encoded bytes in order.
+
+    Tiles smaller than tile_shape (e.g. at the image edges) are zero
+    padded before encoding. At most 2 * num_workers tiles are held in
+    memory at once.
+
+    Args:
+        tiles (Iterable[np.ndarray]):
+            The tiles to encode.
+        encode (Callable[[np.ndarray], bytes]):
+            Function to encode a tile. Must release the GIL to benefit
+            from multiple workers (e.g. imagecodecs encoders).
+        tile_shape (Tuple[int, ...]):
+            The shape of a full tile.
+        num_workers (int, optional):
+            Number of threads to encode with. Defaults to 2.
+
+    Yields:
+        bytes:
+            The encoded tiles.
+    """
+
+    def pad_and_encode(tile: np.ndarray) -> bytes:
+        if tile.shape != tile_shape[: tile.ndim]:
+            pad = [(0, t - s) for t, s in zip(tile_shape, tile.shape)]
+            tile = np.pad(tile, pad)
+        return encode(np.ascontiguousarray(tile))
+
+    pending = deque()
+    with ThreadPoolExecutor(max(1, num_workers)) as executor:
+        for tile in tiles:
+            pending.append(executor.submit(pad_and_encode, tile))
+            if len(pending) >= 2 * max(1, num_workers):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def _cv2_downsample(image: np.ndarray, factor: int) -> np.ndarray:
     """Resample an image using OpenCV.
 
@@ -1925,6 +2076,12 @@ def _scipy_downsample(image: np.ndarray, factor: int) -> np.ndarray:
 def _np_downsample(image: np.ndarray, factor: int) -> np.ndarray:
     """Resample an image using NumPy.
 
+    Takes the mean of each factor x factor block by summing the strided
+    views of each block offset. The sum is accumulated in uint16 for
+    uint8 images (exact for factors up to 16), which avoids converting
+    the whole image to float and reducing over a non-contiguous block
+    view.
+
     Args:
         image (np.ndarray):
             The image to resample.
@@ -1935,7 +2092,14 @@ def _np_downsample(image: np.ndarray, factor: int) -> np.ndarray:
         np.ndarray:
             The resampled image.
     """
-    return mean_pool(image.astype(float), factor).clip(0, 255).astype(np.uint8)
+    height, width = image.shape[0] // factor, image.shape[1] // factor
+    accumulator_dtype = (
+        np.uint16 if image.dtype == np.uint8 and factor <= 16 else np.float64
+    )
+    total = np.zeros((height, width) + image.shape[2:], dtype=accumulator_dtype)
+    for dy, dx in np.ndindex(factor, factor):
+        total += image[dy : height * factor : factor, dx : width * factor : factor]
+    return (total // (factor * factor)).clip(0, 255).astype(np.uint8)
 
 
 def downsample_tile(
@@ -1982,6 +2146,20 @@ def downsample_tile(
     )
 
 
+@lru_cache(maxsize=4)
+def _open_intermediate(path: str) -> zarr.Array:
+    """Open an intermediate zarr for reading.
+
+    Cached so that each worker process opens the intermediate once
+    instead of once per tile.
+
+    Args:
+        path (str):
+            The path to the intermediate file (zarr).
+    """
+    return zarr.open(path, mode="r")
+
+
 def get_level_tile(
     yx: Tuple[int, int],
     tile_size: Tuple[int, int],
@@ -2009,6 +2187,6 @@ def get_level_tile(
         slice(y * h * downsample, (y + 1) * h * downsample),
         slice(x * w * downsample, (x + 1) * w * downsample),
     )
-    reader = zarr.open(read_intermediate_path, mode="r")
+    reader = _open_intermediate(str(read_intermediate_path))
     tile = reader[tile_index]
     return downsample_tile(tile, downsample, method=downsample_method)